@@ -8,6 +8,7 @@ import {
   Runtime,
   Stream,
 } from "effect";
+import { vi } from "vite-plus/test";
 import type * as vscode from "vscode";
 
 import { TestVsCode } from "../../__mocks__/TestVsCode.ts";
@@ -40,6 +41,28 @@ function parseDapMessages(raw: string): unknown[] {
   return messages;
 }
 
+/** Split raw bytes into DAP frames, reading Content-Length as a byte count. */
+function parseDapFrames(
+  bytes: Buffer,
+): Array<{ contentLength: number; body: unknown }> {
+  const frames: Array<{ contentLength: number; body: unknown }> = [];
+  let offset = 0;
+  while (true) {
+    const headerEnd = bytes.indexOf("\r\n\r\n", offset);
+    if (headerEnd === -1) break;
+    const header = bytes.toString("ascii", offset, headerEnd);
+    const match = /Content-Length:\s*(\d+)/i.exec(header);
+    if (!match) break;
+    const contentLength = Number.parseInt(match[1], 10);
+    const bodyStart = headerEnd + 4;
+    if (bytes.length < bodyStart + contentLength) break;
+    const body = bytes.toString("utf-8", bodyStart, bodyStart + contentLength);
+    frames.push({ contentLength, body: JSON.parse(body) });
+    offset = bodyStart + contentLength;
+  }
+  return frames;
+}
+
 // ---------------------------------------------------------------------------
 // Mock debugpy TCP server as a scoped Effect service
 // ---------------------------------------------------------------------------
@@ -105,6 +128,18 @@ function takeFirstMessage(conn: Connection) {
   );
 }
 
+/** Read raw bytes from the connection until `count` DAP frames have arrived. */
+function takeFrames(conn: Connection, count: number) {
+  return conn.messages.pipe(
+    Stream.runFoldWhile(
+      Buffer.alloc(0),
+      (bytes) => parseDapFrames(bytes).length < count,
+      (bytes, chunk) => Buffer.concat([bytes, chunk]),
+    ),
+    Effect.map(parseDapFrames),
+  );
+}
+
 describe("makeDapProxy", () => {
   it.scoped(
     "rewrites source.path in setBreakpoints (cell URI -> temp file)",
@@ -231,4 +266,53 @@ describe("makeDapProxy", () => {
         `);
     }),
   );
+
+  it.scoped(
+    "uses the UTF-8 byte length of the body as Content-Length",
+    Effect.fn(function* () {
+      const { proxy, conn } = yield* withTestCtx(createSourceMapping({}));
+      const message = {
+        type: "request",
+        seq: 4,
+        command: "evaluate",
+        arguments: { expression: "print('héllo 🐍')" },
+      };
+
+      proxy.adapter.handleMessage(message);
+
+      expect(yield* takeFrames(conn, 1)).toEqual([
+        {
+          contentLength: Buffer.byteLength(JSON.stringify(message), "utf-8"),
+          body: message,
+        },
+      ]);
+    }),
+  );
+
+  it.scoped(
+    "flushes frames sent in the same tick together, in order",
+    Effect.fn(function* () {
+      const uncork = vi.spyOn(NodeNet.Socket.prototype, "uncork");
+      yield* Effect.addFinalizer(() => Effect.sync(() => uncork.mockRestore()));
+      const { proxy, conn } = yield* withTestCtx(createSourceMapping({}));
+      const messages = [
+        {
+          type: "request",
+          seq: 5,
+          command: "setBreakpoints",
+          arguments: { source: { path: TEMP_FILE }, breakpoints: [] },
+        },
+        { type: "request", seq: 6, command: "setExceptionBreakpoints" },
+        { type: "request", seq: 7, command: "configurationDone" },
+      ];
+
+      for (const message of messages) {
+        proxy.adapter.handleMessage(message);
+      }
+
+      const frames = yield* takeFrames(conn, messages.length);
+      expect(frames.map((frame) => frame.body)).toEqual(messages);
+      expect(uncork).toHaveBeenCalledTimes(1);
+    }),
+  );
 });
@@ -192,10 +192,24 @@ export const makeDapProxy = Effect.fn("makeDapProxy")(function* (
     Effect.forkScoped,
   );
 
+  // Whether the socket is corked until the end of the current tick.
+  let corked = false;
+
   function sendToDebugpy(message: vscode.DebugProtocolMessage): void {
-    const json = JSON.stringify(message);
-    const header = `Content-Length: ${Buffer.byteLength(json, "utf-8")}\r\n\r\n`;
-    socket.write(header + json, "utf-8");
+    // Encode the body once: its byte length is the Content-Length. Frames
+    // sent in the same tick (e.g. setBreakpoints followed by
+    // configurationDone) stay corked and are flushed as one writev.
+    const body = Buffer.from(JSON.stringify(message), "utf-8");
+    if (!corked) {
+      corked = true;
+      socket.cork();
+      process.nextTick(() => {
+        corked = false;
+        socket.uncork();
+      });
+    }
+    socket.write(`Content-Length: ${body.length}\r\n\r\n`, "ascii");
+    socket.write(body);
   }
 
   return {
@@ -2,9 +2,7 @@
 
 """Marimo Language Server Protocol implementation."""
 
-import logging
-
-from marimo_lsp.loggers import get_logger, lsp_handler
+from marimo_lsp.loggers import get_logger, level_from_env, lsp_handler
 from marimo_lsp.server import create_server
 
 
@@ -16,6 +14,7 @@ def main() -> None:
 
     server = create_server(kernels=NativeKernels())
     logger = get_logger()
-    logger.setLevel(logging.DEBUG)
+    # Records below this level are dropped before they are formatted or sent.
+    logger.setLevel(level_from_env())
     logger.addHandler(lsp_handler(server))
     server.start_io()
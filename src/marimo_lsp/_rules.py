@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import ast
+import weakref
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
@@ -38,73 +39,81 @@ def _cell_display_name(
     return f"cell {idx + 1}" if idx is not None else str(cell_id)
 
 
-def _find_definition_positions(
-    mod: ast.Module, name: str
-) -> list[tuple[int, int, int]]:
+type _Position = tuple[int, int, int]
+
+# Definition positions per cell AST, keyed weakly so entries go away with
+# the compiled cell. Compiled cells are reused across recompiles, so this
+# is built once per source version rather than once per (name, cell).
+_definition_indexes: weakref.WeakKeyDictionary[
+    ast.Module, dict[str, list[_Position]]
+] = weakref.WeakKeyDictionary()
+
+
+def _find_definition_positions(mod: ast.Module, name: str) -> list[_Position]:
     """Find positions where a variable is defined at module level.
 
     Returns list of (line_0based, col_start, col_end) tuples.
     """
-    positions: list[tuple[int, int, int]] = []
-    for node in mod.body:
-        _collect_def_positions(node, name, positions)
-    return positions
+    index = _definition_indexes.get(mod)
+    if index is None:
+        index = {}
+        for node in mod.body:
+            _collect_def_positions(node, index)
+        _definition_indexes[mod] = index
+    return index.get(name, [])
 
 
 def _collect_def_positions(  # noqa: C901, PLR0912
-    node: ast.AST, name: str, out: list[tuple[int, int, int]]
+    node: ast.AST, out: dict[str, list[_Position]]
 ) -> None:
-    """Collect definition positions for a name from a single AST statement."""
+    """Collect definition positions by name from a single AST statement."""
     match node:
-        case ast.FunctionDef(name=n) if n == name:
+        case ast.FunctionDef(name=name):
             col = node.col_offset + len("def ")
-            out.append((node.lineno - 1, col, col + len(name)))
-        case ast.AsyncFunctionDef(name=n) if n == name:
+            out.setdefault(name, []).append((node.lineno - 1, col, col + len(name)))
+        case ast.AsyncFunctionDef(name=name):
             col = node.col_offset + len("async def ")
-            out.append((node.lineno - 1, col, col + len(name)))
-        case ast.ClassDef(name=n) if n == name:
+            out.setdefault(name, []).append((node.lineno - 1, col, col + len(name)))
+        case ast.ClassDef(name=name):
             col = node.col_offset + len("class ")
-            out.append((node.lineno - 1, col, col + len(name)))
+            out.setdefault(name, []).append((node.lineno - 1, col, col + len(name)))
         case ast.Assign(targets=targets):
             for target in targets:
-                _collect_name_stores(target, name, out)
+                _collect_name_stores(target, out)
         case ast.AugAssign(target=target):
-            _collect_name_stores(target, name, out)
+            _collect_name_stores(target, out)
         case ast.AnnAssign(target=target) if target:
-            _collect_name_stores(target, name, out)
+            _collect_name_stores(target, out)
         case ast.Import(names=aliases) | ast.ImportFrom(names=aliases):
             for alias in aliases:
                 bound = alias.asname or alias.name
-                if bound == name:
-                    line = getattr(alias, "lineno", node.lineno)
-                    end_col = getattr(alias, "end_col_offset", None)
-                    if end_col is not None:
-                        # Highlight just the bound name at the end of the alias span
-                        col = end_col - len(bound)
-                    else:
-                        col = getattr(alias, "col_offset", node.col_offset)
-                    out.append((line - 1, col, col + len(bound)))
+                line = getattr(alias, "lineno", node.lineno)
+                end_col = getattr(alias, "end_col_offset", None)
+                if end_col is not None:
+                    # Highlight just the bound name at the end of the alias span
+                    col = end_col - len(bound)
+                else:
+                    col = getattr(alias, "col_offset", node.col_offset)
+                out.setdefault(bound, []).append((line - 1, col, col + len(bound)))
         case ast.For(target=target) | ast.AsyncFor(target=target):
-            _collect_name_stores(target, name, out)
+            _collect_name_stores(target, out)
         case ast.With(items=items) | ast.AsyncWith(items=items):
             for item in items:
                 if item.optional_vars:
-                    _collect_name_stores(item.optional_vars, name, out)
+                    _collect_name_stores(item.optional_vars, out)
 
 
-def _collect_name_stores(
-    target: ast.AST, name: str, out: list[tuple[int, int, int]]
-) -> None:
-    """Recursively find Name(Store) nodes matching a name in assignment targets."""
+def _collect_name_stores(target: ast.AST, out: dict[str, list[_Position]]) -> None:
+    """Recursively find Name(Store) nodes in assignment targets."""
     match target:
-        case ast.Name(id=id_, col_offset=col, end_col_offset=end_col) if id_ == name:
-            end = end_col or (col + len(name))
-            out.append((target.lineno - 1, col, end))
+        case ast.Name(id=id_, col_offset=col, end_col_offset=end_col):
+            end = end_col or (col + len(id_))
+            out.setdefault(id_, []).append((target.lineno - 1, col, end))
         case ast.Tuple(elts=elts) | ast.List(elts=elts):
             for elt in elts:
-                _collect_name_stores(elt, name, out)
+                _collect_name_stores(elt, out)
         case ast.Starred(value=value):
-            _collect_name_stores(value, name, out)
+            _collect_name_stores(value, out)
 
 
 def multiple_definitions(
@@ -5,7 +5,9 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import dataclasses
+import functools
 import inspect
 import json
 import keyword
@@ -40,6 +42,7 @@ from marimo._schemas.serialization import (
 )
 from marimo._session.requests import InstantiateNotebookRequest
 from marimo._session.state.serialize import serialize_session_view
+from marimo._utils.platform import is_pyodide
 from pygls.uris import to_fs_path
 from typing_extensions import TypeForm
 
@@ -120,6 +123,18 @@ def _as_partial_marimo_config(config: dict[str, object]) -> PartialMarimoConfig:
     return cast("PartialMarimoConfig", config)
 
 
+async def _run_blocking[**P, R](
+    func: typing.Callable[P, R], /, *args: P.args, **kwargs: P.kwargs
+) -> R:
+    """Run blocking work in a worker thread so the event loop stays responsive.
+
+    Pyodide cannot start threads, so the WASM server runs the work inline.
+    """
+    if is_pyodide():
+        return func(*args, **kwargs)
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
 @dataclasses.dataclass(frozen=True)
 class ApiContext:
     """Server-side dependencies available to API handlers."""
@@ -262,7 +277,7 @@ async def set_ui_element_value(
     ctx: ApiContext,
     args: NotebookCommand[UpdateUIElementRequest],
 ) -> None:
-    logger.info(f"set_ui_element_value for {args.notebook_uri}")
+    logger.debug(f"set_ui_element_value for {args.notebook_uri}")
     session = ctx.sessions.get(args.notebook_uri)
     assert session, f"No session in workspace for {args.notebook_uri}"
     session.put_control_request(args.inner.as_command(), from_consumer_id=None)
@@ -273,7 +288,7 @@ async def set_model_value(
     ctx: ApiContext,
     args: NotebookCommand[ModelRequest],
 ) -> None:
-    logger.info(f"set_model_value for {args.notebook_uri}")
+    logger.debug(f"set_model_value for {args.notebook_uri}")
     session = ctx.sessions.get(args.notebook_uri)
     assert session, f"No session in workspace for {args.notebook_uri}"
     session.put_control_request(args.inner.as_command(), from_consumer_id=None)
@@ -284,7 +299,7 @@ async def function_call_request(
     ctx: ApiContext,
     args: NotebookCommand[InvokeFunctionCommand],
 ) -> None:
-    logger.info(f"function_call_request for {args.notebook_uri}")
+    logger.debug(f"function_call_request for {args.notebook_uri}")
     session = ctx.sessions.get(args.notebook_uri)
     assert session, f"No session in workspace for {args.notebook_uri}"
     session.put_control_request(args.inner, from_consumer_id=None)
@@ -467,7 +482,9 @@ async def get_package_list(
 ) -> ListPackagesResponse:
     logger.info(f"get_package_list for {args.notebook_uri}")
     package_manager = _package_manager_for(args.source)
-    if not package_manager.is_manager_installed():
+    # The package manager shells out to `uv`; keep the event loop free for
+    # other LSP requests while it runs.
+    if not await _run_blocking(package_manager.is_manager_installed):
         logger.warning(f"Package manager not installed for {args.notebook_uri}")
         return ListPackagesResponse(packages=[])
 
@@ -479,10 +496,11 @@ async def get_package_list(
         filename = _script_filename(args.notebook_uri)
         if filename is None:
             return ListPackagesResponse(packages=[])
-        tree = package_manager.dependency_tree(filename)
+        tree = await _run_blocking(package_manager.dependency_tree, filename)
         return ListPackagesResponse(packages=_flatten_tree(tree))
 
-    return ListPackagesResponse(packages=package_manager.list_packages())
+    packages = await _run_blocking(package_manager.list_packages)
+    return ListPackagesResponse(packages=packages)
 
 
 @marimo_api("get-dependency-tree")
@@ -499,9 +517,9 @@ async def get_dependency_tree(
         filename = _script_filename(args.notebook_uri)
         if filename is None:
             return DependencyTreeResponse(tree=None)
-        tree = package_manager.dependency_tree(filename)
+        tree = await _run_blocking(package_manager.dependency_tree, filename)
     else:
-        tree = package_manager.dependency_tree()
+        tree = await _run_blocking(package_manager.dependency_tree)
 
     return DependencyTreeResponse(tree=tree)
 
@@ -547,13 +565,17 @@ def _flatten_tree(tree: object) -> list[PackageDescription]:
     return sorted(packages, key=lambda p: p.name)
 
 
+@functools.lru_cache(maxsize=32)
 def _package_manager_for(source: VenvSource | ScriptSource) -> LspPackageManager:
-    """Build a package manager for the given environment source.
+    """Get the package manager for the given environment source.
 
     We pin the underlying tool to `uv` for both variants today: `uv pip list`
     works against any python env, and `uv tree --script` is the only way to
     introspect a PEP 723 script's deps. A future server-side change can pick
     the user's preferred manager for venv mode without a wire-protocol change.
+
+    Sources are frozen structs, so equal sources share one cached manager
+    instead of rebuilding it on every package-panel refresh.
     """
     venv_location = source.executable if isinstance(source, VenvSource) else None
     return LspPackageManager(
@@ -564,6 +586,10 @@ def _package_manager_for(source: VenvSource | ScriptSource) -> LspPackageManager
 
 @marimo_api("serialize")
 async def serialize(_ctx: ApiContext, args: NotebookDocument) -> SerializeResponse:
+    return await _run_blocking(_serialize, args)
+
+
+def _serialize(args: NotebookDocument) -> SerializeResponse:
     ir = MarimoConvert.from_notebook_v1(args.notebook).to_ir()
     known_options = {
         name: value
@@ -649,6 +675,10 @@ async def deserialize(
     _ctx: ApiContext,
     args: DeserializeRequest,
 ) -> DeserializeResult:
+    return await _run_blocking(_deserialize, args)
+
+
+def _deserialize(args: DeserializeRequest) -> DeserializeResult:
     try:
         converter = MarimoConvert.from_py(args.source)
         ir = converter.to_ir()
@@ -744,10 +774,14 @@ async def update_configuration(
     session = ctx.sessions.get(args.notebook_uri)
     if not session:
         manager = get_default_config_manager(current_path=to_fs_path(args.notebook_uri))
-        manager.save_config(config)
+        await _run_blocking(manager.save_config, config)
         return manager.get_config()
 
-    return session.save_config(config)
+    # Write the config file off the loop; apply it to the kernel on the loop,
+    # where the session's other state changes happen.
+    updated = await _run_blocking(session.config_manager.save_config, config)
+    session.update_runtime_config(updated)
+    return updated
 
 
 @marimo_api("set-display-theme")
@@ -47,18 +47,22 @@ class LspAppFileManager:
 
     def __init__(self, *, server: LanguageServer, notebook_uri: str) -> None:
         self._server = server
-        self._notebook_uri = notebook_uri
+        self._set_notebook_uri(notebook_uri)
         self.app = sync_app_with_workspace(
             workspace=server.workspace, notebook_uri=notebook_uri, app=None
         )
 
+    def _set_notebook_uri(self, notebook_uri: str) -> None:
+        # Resolve the path once per URI; session snapshots read the filename
+        # on every status change.
+        self._notebook_uri = notebook_uri
+        self._path = to_fs_path(notebook_uri)
+        self._filename = pathlib.Path(self._path).name if self._path else None
+
     @property
     def filename(self) -> str | None:
         """The notebook file name."""
-        maybe_path = self.path
-        if maybe_path:
-            return pathlib.Path(maybe_path).name
-        return None
+        return self._filename
 
     @property
     def path(self) -> str | None:
@@ -66,11 +70,11 @@ class LspAppFileManager:
 
         This is used by Session for caching and identification purposes.
         """
-        return to_fs_path(self._notebook_uri)
+        return self._path
 
     def move(self, notebook_uri: str) -> None:
         """Update the URI after the backing notebook is renamed."""
-        self._notebook_uri = notebook_uri
+        self._set_notebook_uri(notebook_uri)
 
     @property
     def is_notebook_named(self) -> bool:
@@ -198,6 +202,17 @@ def sync_app_with_workspace(
         configs.append(CellConfig.from_dict(dict(config)))
         names.append(name)
 
+    cell_manager = app.cell_manager
+    if (
+        cell_ids == list(cell_manager.cell_ids())
+        and codes == list(cell_manager.codes())
+        and names == list(cell_manager.names())
+        and configs == list(cell_manager.configs())
+    ):
+        # Nothing changed since the last sync (e.g. a save right after the
+        # debounced edit sync); skip rebuilding and diffing the cell manager.
+        return app
+
     return app.with_data(
         cell_ids=cell_ids,
         codes=codes,
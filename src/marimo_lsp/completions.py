@@ -12,6 +12,19 @@ from pygls.uris import to_fs_path
 if typing.TYPE_CHECKING:
     from pygls.lsp.server import LanguageServer
 
+# Line prefixes that offer the cell snippet.
+_CELL_TRIGGERS = frozenset({"@", "@a", "@ap", "@app"})
+
+# The snippet never varies, so it is built once and reused for every request.
+_CELL_COMPLETION = lsp.CompletionItem(
+    label="@app.cell",
+    kind=lsp.CompletionItemKind.Snippet,
+    detail="Insert a new marimo cell",
+    documentation="Creates a new marimo cell",
+    insert_text="@app.cell\ndef _():\n    ${2:}\n    return",
+    insert_text_format=lsp.InsertTextFormat.Snippet,
+)
+
 
 def get_completions(
     ls: LanguageServer, params: lsp.CompletionParams
@@ -33,16 +46,7 @@ def get_completions(
         current_line = lines[current_line_idx]
         line_prefix = current_line[: params.position.character]
 
-        if line_prefix.strip() in ["@", "@a", "@ap", "@app"]:
-            completions.append(
-                lsp.CompletionItem(
-                    label="@app.cell",
-                    kind=lsp.CompletionItemKind.Snippet,
-                    detail="Insert a new marimo cell",
-                    documentation="Creates a new marimo cell",
-                    insert_text="@app.cell\ndef _():\n    ${2:}\n    return",
-                    insert_text_format=lsp.InsertTextFormat.Snippet,
-                )
-            )
+        if line_prefix.strip() in _CELL_TRIGGERS:
+            completions.append(_CELL_COMPLETION)
 
     return completions
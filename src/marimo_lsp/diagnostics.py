@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from typing import TYPE_CHECKING
 
 import lsprotocol.types as lsp
@@ -28,21 +29,58 @@ from marimo_lsp.utils import (
 logger = get_logger()
 
 if TYPE_CHECKING:
+    from marimo._ast.cell import CellImpl
     from pygls.lsp.server import LanguageServer
 
+    from marimo_lsp.models import CellMetadata
+
 # Lightweight snapshot of the variable dependency structure.
 # Maps variable_name → (frozenset of declaring cells, frozenset of using cells).
 _VariablesSnapshot = dict[str, tuple[frozenset["CellId_t"], frozenset["CellId_t"]]]
 
+# Cell id -> document URI, display name, and notebook position.
+_CellLayout = tuple[dict["CellId_t", str], dict["CellId_t", str], dict["CellId_t", int]]
+
 _DEBOUNCE_SECONDS = 0.15
 
+# Compiled cells remembered per notebook, so undo/redo or retyping a
+# previous version of a cell doesn't parse it again.
+_COMPILE_CACHE_SIZE = 256
+
+
+def _compile_or_none(cell_id: CellId_t, code: str) -> CellImpl | None:
+    """Compile a cell, returning ``None`` if it has a syntax error.
+
+    Returning rather than raising lets the per-notebook cache remember
+    sources that don't parse, which is most of them while the user types.
+    """
+    try:
+        return compile_cell(cell_id=cell_id, code=code)
+    except SyntaxError:
+        return None
+
+
+def _referring_cells_by_variable(graph: DirectedGraph) -> dict[str, set[CellId_t]]:
+    """Map each referenced name to the cells that reference it.
+
+    Equivalent to ``graph.get_referring_cells(name, language="python")`` for
+    every name, but built in one pass over the cells instead of one pass per
+    variable.
+    """
+    referring: dict[str, set[CellId_t]] = {}
+    for cell_id, cell in graph.cells.items():
+        for ref in cell.refs:
+            referring.setdefault(ref, set()).add(cell_id)
+    return referring
+
 
 def _snapshot_variables(graph: DirectedGraph) -> _VariablesSnapshot:
     """Create a snapshot of the variable dependency structure for cheap comparison."""
+    referring = _referring_cells_by_variable(graph)
     return {
         variable: (
             frozenset(declared_by),
-            frozenset(graph.get_referring_cells(variable, language="python")),
+            frozenset(referring.get(variable, ())),
         )
         for variable, declared_by in graph.definitions.items()
     }
@@ -87,11 +125,20 @@ class NotebookGraphUpdater:
     def __init__(self, server: LanguageServer, notebook_uri: str) -> None:
         self._server = server
         self._notebook_uri = notebook_uri
+        # Last compiled source per cell, to skip unchanged cells without a
+        # lookup in the (bounded) compile cache below.
         self._cell_sources: dict[CellId_t, str] = {}
         self._graph: DirectedGraph = DirectedGraph()
         self._last_published: _VariablesSnapshot | None = None
         self._debounce_handle: asyncio.TimerHandle | None = None
         self._cached_diagnostics: dict[str, list[lsp.Diagnostic]] = {}
+        # The (uri, name, index) maps the cached diagnostics were built from.
+        self._cell_layout: _CellLayout | None = None
+        self._compile_cell = functools.lru_cache(maxsize=_COMPILE_CACHE_SIZE)(
+            _compile_or_none
+        )
+        # Cell document URI -> (raw metadata object, decoded metadata).
+        self._cell_metadata: dict[str, tuple[object, CellMetadata]] = {}
 
     def schedule(self) -> None:
         """Schedule a debounced recompilation.
@@ -117,6 +164,24 @@ class NotebookGraphUpdater:
 
     # -- internal helpers -----------------------------------------------
 
+    def _decode_metadata(
+        self,
+        cell: lsp.NotebookCell,
+        seen: dict[str, tuple[object, CellMetadata]],
+    ) -> CellMetadata:
+        """Decode cell metadata, reusing the last result if it wasn't replaced.
+
+        Notebook sync swaps in a fresh metadata object whenever a cell's
+        metadata changes, so identity is enough to detect staleness.
+        """
+        cached = self._cell_metadata.get(cell.document)
+        if cached is not None and cached[0] is cell.metadata:
+            meta = cached[1]
+        else:
+            meta = decode_cell_metadata(cell)
+        seen[cell.document] = (cell.metadata, meta)
+        return meta
+
     def _recompile(self) -> None:  # noqa: C901
         """Read all cells from workspace, compile changed ones, publish if needed."""
         self._debounce_handle = None
@@ -130,9 +195,11 @@ class NotebookGraphUpdater:
         cell_names: dict[CellId_t, str] = {}
         cell_index: dict[CellId_t, int] = {}
 
+        graph_changed = False
         current_ids: set[CellId_t] = set()
+        seen_metadata: dict[str, tuple[object, CellMetadata]] = {}
         for idx, cell in enumerate(notebook.cells):
-            meta = decode_cell_metadata(cell)
+            meta = self._decode_metadata(cell, seen_metadata)
             if meta.marimo_runtime.stable_id is None:
                 continue
             cell_id = CellId_t(meta.marimo_runtime.stable_id)
@@ -154,42 +221,52 @@ class NotebookGraphUpdater:
                 continue
 
             self._cell_sources[cell_id] = source
+            graph_changed = True
 
             if cell_id in self._graph.cells:
                 self._graph.delete_cell(cell_id)
 
-            try:
-                compiled = compile_cell(cell_id=cell_id, code=source)
+            compiled = self._compile_cell(cell_id, source)
+            if compiled is not None:
+                # Cells with syntax errors are left out of the graph
                 self._graph.register_cell(cell_id=cell_id, cell=compiled)
-            except SyntaxError:
-                # Cell has syntax error — don't add to graph
-                pass
+
+        # Only keep decoded metadata for cells still in the notebook
+        self._cell_metadata = seen_metadata
 
         # Remove cells no longer in the notebook
         for removed_id in set(self._cell_sources) - current_ids:
             self._cell_sources.pop(removed_id)
+            graph_changed = True
             if removed_id in self._graph.cells:
                 self._graph.delete_cell(removed_id)
 
+        # Diagnostics are a function of the graph and the cell layout; if
+        # neither moved, the published state is already current.
+        layout = (cell_id_to_uri, cell_names, cell_index)
+        if not graph_changed and layout == self._cell_layout:
+            return
+        self._cell_layout = layout
+
         # Publish variables if the dependency structure changed
         snapshot = _snapshot_variables(self._graph)
         if snapshot != self._last_published:
             self._last_published = snapshot
-            _publish_variables(self._server, notebook, self._graph)
+            _publish_variables(self._server, notebook, snapshot)
 
         # Recompute and push diagnostics to all affected cells
         new_diagnostics = _compute_diagnostics(
             self._graph, cell_id_to_uri, cell_names, cell_index
         )
 
-        # Publish for every cell that has or previously had diagnostics
-        # (empty list clears stale diagnostics)
+        # Publish for every cell whose diagnostics changed, including cells
+        # that no longer have any (empty list clears stale diagnostics)
         for uri in set(new_diagnostics) | set(self._cached_diagnostics):
+            diagnostics = new_diagnostics.get(uri, [])
+            if diagnostics == self._cached_diagnostics.get(uri, []):
+                continue
             self._server.text_document_publish_diagnostics(
-                lsp.PublishDiagnosticsParams(
-                    uri=uri,
-                    diagnostics=new_diagnostics.get(uri, []),
-                )
+                lsp.PublishDiagnosticsParams(uri=uri, diagnostics=diagnostics)
             )
 
         self._cached_diagnostics = new_diagnostics
@@ -204,11 +281,11 @@ class GraphUpdaterRegistry:
 
     def get_or_create(self, notebook_uri: str) -> NotebookGraphUpdater:
         """Return the updater for *notebook_uri*, creating one if needed."""
-        if notebook_uri not in self._updaters:
-            self._updaters[notebook_uri] = NotebookGraphUpdater(
-                self._server, notebook_uri
-            )
-        return self._updaters[notebook_uri]
+        updater = self._updaters.get(notebook_uri)
+        if updater is None:
+            updater = NotebookGraphUpdater(self._server, notebook_uri)
+            self._updaters[notebook_uri] = updater
+        return updater
 
     def remove(self, notebook_uri: str) -> None:
         """Remove the updater for *notebook_uri*, cancelling any pending timer."""
@@ -219,14 +296,19 @@ class GraphUpdaterRegistry:
 
 def extract_variables(graph: DirectedGraph) -> VariablesNotification:
     """Extract variable declarations and usages from the directed graph."""
+    return _variables_from_snapshot(_snapshot_variables(graph))
+
+
+def _variables_from_snapshot(snapshot: _VariablesSnapshot) -> VariablesNotification:
+    """Build the variables notification from an already computed snapshot."""
     return VariablesNotification(
         variables=[
             VariableDeclarationNotification(
                 name=VariableName(variable),
                 declared_by=list(declared_by),
-                used_by=list(graph.get_referring_cells(variable, language="python")),
+                used_by=list(used_by),
             )
-            for variable, declared_by in graph.definitions.items()
+            for variable, (declared_by, used_by) in snapshot.items()
         ]
     )
 
@@ -234,10 +316,10 @@ def extract_variables(graph: DirectedGraph) -> VariablesNotification:
 def _publish_variables(
     server: LanguageServer,
     notebook: lsp.NotebookDocument,
-    graph: DirectedGraph,
+    snapshot: _VariablesSnapshot,
 ) -> None:
     """Send a ``marimo/operation`` notification with the current variable state."""
-    variables = extract_variables(graph)
+    variables = _variables_from_snapshot(snapshot)
     server.protocol.notify(
         "marimo/operation",
         {"notebookUri": notebook.uri, "operation": asdict(variables)},
@@ -4,7 +4,13 @@
 
 from __future__ import annotations
 
+import collections
+import contextlib
+import os
+import selectors
 import subprocess
+import sys
+import threading
 import typing
 from pathlib import Path
 
@@ -27,6 +33,15 @@ if typing.TYPE_CHECKING:
 
 logger = get_logger()
 
+# Seconds to wait for a kernel that closed stdout during startup to exit.
+_EXIT_TIMEOUT = 1.0
+
+# Trailing kernel stderr lines kept to explain a failed startup.
+_STDERR_TAIL_LINES = 200
+
+# Bytes read from a kernel pipe each time it becomes readable.
+_READ_CHUNK_SIZE = 64 * 1024
+
 
 class InvalidWorkingDirectoryError(ValueError):
     """The requested kernel working directory is unsafe or unavailable."""
@@ -69,6 +84,17 @@ def launch_kernel(
     assert process.stdout, "Expect subprocess stdout pipe"
     assert process.stderr, "Expect subprocess stderr pipe"
 
+    # Drain stderr from the start so the kernel never blocks on a full pipe,
+    # even before the handshake. Until then, the most recent lines are kept
+    # to explain a failed start.
+    stderr = _KernelPipe(
+        process.stderr,
+        process.pid,
+        "stderr",
+        tail=collections.deque(maxlen=_STDERR_TAIL_LINES),
+    )
+    _drainer.add(stderr)
+
     # Send over stdin
     process.stdin.write(args.encode_json())
     process.stdin.flush()
@@ -77,28 +103,162 @@ def launch_kernel(
     logger.debug("Waiting for KERNEL_READY signal from kernel subprocess")
 
     # Wait for "KERNEL_READY" message
-    ready_line = process.stdout.readline().decode("utf-8").strip()
+    ready_line = _read_ready_line(process.stdout.fileno())
     if ready_line != "KERNEL_READY":
+        if not ready_line:
+            # stdout closed: the kernel is exiting, let it finish writing
+            with contextlib.suppress(subprocess.TimeoutExpired):
+                process.wait(timeout=_EXIT_TIMEOUT)
         exit_code = process.poll()
-        stderr = process.stderr.read().decode("utf-8", errors="replace")
+        if exit_code is not None:
+            stderr.closed.wait(timeout=_EXIT_TIMEOUT)
+        output = "\n".join(stderr.tail or ())
 
         if exit_code is not None and exit_code != 0:
-            msg = f"Kernel failed to start (exit code {exit_code}): {stderr}"
+            msg = f"Kernel failed to start (exit code {exit_code}): {output}"
             logger.error(msg)
             raise RuntimeError(msg)
 
         msg = (
-            f"Invalid kernel response. Expected 'KERNEL_READY', got: '{ready_line}'. "
-            f"Stderr: {stderr}"
+            f"Invalid kernel response. Expected 'KERNEL_READY', got: "
+            f"'{ready_line}'. Stderr: {output}"
         )
         logger.error(msg)
         process.terminate()
         raise RuntimeError(msg)
 
     logger.info(f"Kernel subprocess started successfully with PID: {process.pid}")
+    # Started fine: stderr is only logged from here on.
+    stderr.tail = None
+    # Keep reading stdout after the handshake so the kernel never blocks on
+    # a full pipe.
+    _drainer.add(_KernelPipe(process.stdout, process.pid, "stdout"))
     return Process(inner=process)
 
 
+def _read_ready_line(fd: int) -> str:
+    """Read the kernel's first stdout line, one byte at a time.
+
+    Going around the buffered stream leaves everything after the line in
+    the pipe, where the drainer picks it up.
+    """
+    line = bytearray()
+    while (byte := _read_chunk(fd, 1)) and byte != b"\n":
+        line += byte
+    return line.decode("utf-8", errors="replace").strip()
+
+
+class _KernelPipe:
+    """A kernel output pipe forwarded to the server log line by line."""
+
+    def __init__(
+        self,
+        stream: typing.IO[bytes],
+        pid: int,
+        name: str,
+        *,
+        tail: collections.deque[str] | None = None,
+    ) -> None:
+        self.stream = stream
+        self.name = f"marimo-kernel-{pid}-{name}"
+        # Recent lines, kept while a caller still needs them (or ``None``).
+        self.tail = tail
+        # Set once the kernel closes its end and every line has been logged.
+        self.closed = threading.Event()
+        self._pid = pid
+        self._pending = b""
+
+    def feed(self, data: bytes) -> None:
+        """Log the complete lines in ``data``; empty ``data`` means EOF."""
+        if data:
+            *lines, self._pending = (self._pending + data).split(b"\n")
+        else:
+            # Flush a last line the kernel didn't terminate
+            lines = [self._pending] if self._pending else []
+        for line in lines:
+            text = line.decode("utf-8", errors="replace").rstrip()
+            if (tail := self.tail) is not None:
+                tail.append(text)
+            logger.debug(f"[kernel {self._pid}] {text}")
+        if not data:
+            self.stream.close()
+            self.closed.set()
+
+
+class _PipeDrainer:
+    """Drains kernel output pipes from one shared background thread.
+
+    A selector watches every registered pipe, so the thread count doesn't
+    grow with the number of kernels. Windows can't select on pipes, so
+    there each pipe gets its own reader thread instead.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._added: list[_KernelPipe] = []
+        self._wakeup: int | None = None
+
+    def add(self, pipe: _KernelPipe) -> None:
+        """Start draining ``pipe`` until the kernel closes it."""
+        if sys.platform == "win32":
+            threading.Thread(
+                target=_read_until_closed, args=(pipe,), name=pipe.name, daemon=True
+            ).start()
+            return
+        with self._lock:
+            self._added.append(pipe)
+            if self._wakeup is None:
+                self._wakeup = self._start()
+            # The selector is only touched from its own thread; wake it up
+            # to register the new pipe.
+            os.write(self._wakeup, b"\0")
+
+    def _start(self) -> int:
+        read_fd, write_fd = os.pipe()
+        threading.Thread(
+            target=self._run, args=(read_fd,), name="marimo-kernel-pipes", daemon=True
+        ).start()
+        return write_fd
+
+    def _run(self, wakeup: int) -> None:
+        with selectors.DefaultSelector() as selector:
+            selector.register(wakeup, selectors.EVENT_READ)
+            while True:
+                for key, _ in selector.select():
+                    if key.fd == wakeup:
+                        os.read(wakeup, _READ_CHUNK_SIZE)
+                        with self._lock:
+                            added, self._added = self._added, []
+                        for pipe in added:
+                            selector.register(pipe.stream, selectors.EVENT_READ, pipe)
+                        continue
+                    data = _read_chunk(key.fd)
+                    if not data:
+                        selector.unregister(key.fileobj)
+                    try:
+                        key.data.feed(data)
+                    except Exception:
+                        # Keep draining the other kernels' pipes
+                        logger.exception(f"Failed to drain {key.data.name}")
+
+
+def _read_chunk(fd: int, size: int = _READ_CHUNK_SIZE) -> bytes:
+    try:
+        return os.read(fd, size)
+    except OSError:
+        return b""
+
+
+def _read_until_closed(pipe: _KernelPipe) -> None:
+    fd = pipe.stream.fileno()
+    while data := _read_chunk(fd):
+        pipe.feed(data)
+    pipe.feed(b"")
+
+
+_drainer = _PipeDrainer()
+
+
 class Manager(KernelManagerImpl):
     """Kernel manager for marimo-lsp."""
 
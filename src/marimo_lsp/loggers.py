@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import TYPE_CHECKING
 
 import lsprotocol.types as lsp
@@ -13,19 +14,21 @@ if TYPE_CHECKING:
     from pygls.lsp.server import LanguageServer
 
 
+_LEVEL_MAP = {
+    logging.DEBUG: lsp.MessageType.Log,
+    logging.INFO: lsp.MessageType.Info,
+    logging.WARNING: lsp.MessageType.Warning,
+    logging.ERROR: lsp.MessageType.Error,
+    logging.CRITICAL: lsp.MessageType.Error,
+}
+
+
 class LspLoggingHandler(logging.Handler):
     """Custom logging handler that sends messages through LSP window/logMessage."""
 
     def __init__(self, server: LanguageServer) -> None:
         super().__init__()
         self.server = server
-        self.level_map = {
-            logging.DEBUG: lsp.MessageType.Log,
-            logging.INFO: lsp.MessageType.Info,
-            logging.WARNING: lsp.MessageType.Warning,
-            logging.ERROR: lsp.MessageType.Error,
-            logging.CRITICAL: lsp.MessageType.Error,
-        }
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record through LSP window/logMessage."""
@@ -33,7 +36,7 @@ class LspLoggingHandler(logging.Handler):
             return
         self.server.window_log_message(
             lsp.LogMessageParams(
-                type=self.level_map.get(record.levelno, lsp.MessageType.Log),
+                type=_LEVEL_MAP.get(record.levelno, lsp.MessageType.Log),
                 message=self.format(record),
             )
         )
@@ -46,6 +49,12 @@ def lsp_handler(server: LanguageServer) -> LspLoggingHandler:
     return handler
 
 
+def level_from_env(default: int = logging.DEBUG) -> int:
+    """Read the log level from ``MARIMO_LSP_LOG_LEVEL``, e.g. ``INFO``."""
+    name = os.environ.get("MARIMO_LSP_LOG_LEVEL", "").strip().upper()
+    return logging.getLevelNamesMapping().get(name, default)
+
+
 def get_logger() -> logging.Logger:
     """Get the marimo-lsp logger."""
     return logging.getLogger("marimo-lsp")
@@ -1,6 +1,6 @@
 # Copyright 2026 Marimo. All rights reserved.
 
-"""Marimo models rewritten in attrs for `pygls` compatibility."""
+"""Marimo models as camelCase `msgspec` structs for the LSP wire format."""
 
 from __future__ import annotations
 
@@ -54,7 +54,13 @@ class OwnedAppConfig(msgspec.Struct):
     auto_download: list[str] = msgspec.field(default_factory=list)
 
 
-class NotebookCommand(msgspec.Struct, typing.Generic[T], rename="camel"):  # noqa: UP046
+class NotebookCommand(
+    msgspec.Struct,
+    typing.Generic[T],  # noqa: UP046
+    rename="camel",
+    frozen=True,
+    gc=False,
+):
     """Wraps a marimo command with its target notebook context.
 
     Associates any marimo command/request with the specific notebook
@@ -79,14 +85,28 @@ class SessionCommand(NotebookCommand[T]):
     """Absolute working directory for the launched kernel."""
 
 
-class VenvSource(msgspec.Struct, tag="venv", tag_field="kind", rename="camel"):
+class VenvSource(
+    msgspec.Struct,
+    tag="venv",
+    tag_field="kind",
+    rename="camel",
+    frozen=True,
+    gc=False,
+):
     """The notebook's environment is a concrete venv with a known python executable."""
 
     executable: str
     """Path to the python binary inside the venv."""
 
 
-class ScriptSource(msgspec.Struct, tag="script", tag_field="kind", rename="camel"):
+class ScriptSource(
+    msgspec.Struct,
+    tag="script",
+    tag_field="kind",
+    rename="camel",
+    frozen=True,
+    gc=False,
+):
     """The notebook's environment is a PEP 723 sandbox script.
 
     The server resolves the script filename from the notebook URI; `uv`
@@ -230,7 +250,7 @@ class NotebookDocument(msgspec.Struct, rename="camel"):
     header: str | None = None
 
 
-class DeserializeRequest(msgspec.Struct, rename="camel"):
+class DeserializeRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """
     A request to deserialize Python source to notebook format.
 
@@ -269,34 +289,34 @@ type DeserializeResult = (
 )
 
 
-class ConvertRequest(msgspec.Struct, rename="camel"):
+class ConvertRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to convert a file source a marimo notebook."""
 
     uri: str
     """The identifier for the text document to convert"""
 
 
-class InterruptRequest(msgspec.Struct, rename="camel"):
+class InterruptRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to interrupt the kernel execution."""
 
 
-class ListPackagesRequest(msgspec.Struct, rename="camel"):
+class ListPackagesRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to list installed packages in the kernel environment."""
 
 
-class DependencyTreeRequest(msgspec.Struct, rename="camel"):
+class DependencyTreeRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to get the dependency tree of installed packages."""
 
 
-class GetConfigurationRequest(msgspec.Struct, rename="camel"):
+class GetConfigurationRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to get the current configuration."""
 
 
-class CloseSessionRequest(msgspec.Struct, rename="camel"):
+class CloseSessionRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to close the current session."""
 
 
-class RestartSessionRequest(msgspec.Struct, rename="camel"):
+class RestartSessionRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to restart a live session's kernel."""
 
     executable: str
@@ -309,18 +329,18 @@ class RestartSessionRequest(msgspec.Struct, rename="camel"):
     """Create a replacement only for an explicit restore operation."""
 
 
-class MoveSessionRequest(msgspec.Struct, rename="camel"):
+class MoveSessionRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to move a live session to a renamed notebook URI."""
 
     new_notebook_uri: str
     """The notebook URI after the rename."""
 
 
-class ListSessionsRequest(msgspec.Struct, rename="camel"):
+class ListSessionsRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request for all live sessions owned by this language server."""
 
 
-class ShutdownAllSessionsRequest(msgspec.Struct, rename="camel"):
+class ShutdownAllSessionsRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to close every live session owned by this language server."""
 
 
@@ -343,15 +363,15 @@ class ListSessionsResponse(msgspec.Struct, rename="camel"):
     sessions: list[SessionInfo]
 
 
-class ExportAsIpynbRequest(msgspec.Struct, rename="camel"):
+class ExportAsIpynbRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to export the notebook as ipynb."""
 
 
-class ExportAsMarkdownRequest(msgspec.Struct, rename="camel"):
+class ExportAsMarkdownRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to export the notebook as Markdown."""
 
 
-class ExecuteScratchRequest(msgspec.Struct, rename="camel"):
+class ExecuteScratchRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """Execute arbitrary Python code outside the dependency graph."""
 
     code: str
@@ -366,21 +386,21 @@ class ExecuteScratchRequest(msgspec.Struct, rename="camel"):
     """
 
 
-class UpdateConfigurationRequest(msgspec.Struct, rename="camel"):
+class UpdateConfigurationRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to update the user configuration."""
 
     config: dict[str, object]
     """The partial configuration to merge with the current config."""
 
 
-class SetDisplayThemeRequest(msgspec.Struct, rename="camel"):
+class SetDisplayThemeRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A request to set the display theme without persisting to disk."""
 
     theme: typing.Literal["light", "dark"]
     """The theme to set ('light' or 'dark')."""
 
 
-class ApiRequest(msgspec.Struct, rename="camel"):
+class ApiRequest(msgspec.Struct, rename="camel", frozen=True, gc=False):
     """A unified API request for all marimo internal methods."""
 
     method: str
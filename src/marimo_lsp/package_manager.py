@@ -4,8 +4,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import os
-import subprocess
 from typing import TYPE_CHECKING
 
 from marimo._runtime.packages.utils import sys
@@ -18,6 +19,9 @@ if TYPE_CHECKING:
     from marimo._runtime.packages.package_managers import PackageManager
     from marimo._server.models.packages import DependencyTreeNode
 
+# Read subprocess output in pipe-sized chunks rather than line by line.
+_READ_CHUNK_SIZE = 64 * 1024
+
 
 class LspPackageManager:
     """Package manager for marimo LSP integration."""
@@ -28,6 +32,11 @@ class LspPackageManager:
         super().__init__()
         self._delegate = delegate
         self._venv_location = venv_location
+        # Built once: the server's environment doesn't change between runs.
+        self._env = os.environ.copy()
+        # TODO: fix me, use the correct environment variable
+        if venv_location:
+            self._env["UV_PROJECT_ENVIRONMENT"] = venv_location
         self._delegate.run = self.run  # ty: ignore error[invalid-assignment]
         self._delegate._venv_location = venv_location  # ty: ignore error[invalid-assignment]  # noqa: SLF001
 
@@ -43,41 +52,47 @@ class LspPackageManager:
         """Check if the package manager is installed."""
         return self._delegate.is_manager_installed()
 
-    def run(self, command: list[str], log_callback: LogCallback | None) -> bool:
+    async def run(self, command: list[str], log_callback: LogCallback | None) -> bool:
         """Run a package manager command with optional logging."""
         if not self._delegate.is_manager_installed():
             return False
 
         if log_callback is None:
             # Original behavior - just run the command without capturing output
-            # ruff: noqa: S603
-            completed_process = subprocess.run(command, check=False)
-            return completed_process.returncode == 0
-
-        env = os.environ.copy()
-        # TODO: fix me, use the correct environment variable
-        if self._venv_location:
-            env["UV_PROJECT_ENVIRONMENT"] = self._venv_location
-
-        # Stream output to both the callback and the terminal
-        # ruff: noqa: S603
-        proc = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            env=env,
-            universal_newlines=False,  # Keep as bytes to preserve ANSI codes
-            bufsize=0,  # Unbuffered for real-time output
+            proc = await asyncio.create_subprocess_exec(*command)
+            return await proc.wait() == 0
+
+        # Stream output to both the callback and the terminal. Reads suspend
+        # this coroutine rather than blocking a thread, so other LSP requests
+        # keep being served while the command runs.
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=self._env,
         )
 
         if proc.stdout:
-            for line in iter(proc.stdout.readline, b""):
+            # Chunks can end mid-line or mid-character, so decode incrementally
+            # and only hand complete lines to the callback.
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            pending: list[str] = []
+            # read() returns as soon as any output is available, so output
+            # still streams in real time, but a burst of lines costs one
+            # read and one terminal write instead of one per line.
+            while chunk := await proc.stdout.read(_READ_CHUNK_SIZE):
                 # Send to terminal (original behavior)
-                sys.stdout.buffer.write(line)
+                sys.stdout.buffer.write(chunk)
                 sys.stdout.buffer.flush()
-                # Send to callback for streaming
-                log_callback(line.decode("utf-8", errors="replace"))
-            proc.stdout.close()
-
-        return_code = proc.wait()
-        return return_code == 0
+                # Send complete lines to callback for streaming
+                *lines, rest = decoder.decode(chunk).split("\n")
+                for line in lines:
+                    pending.append(line)
+                    log_callback("".join(pending) + "\n")
+                    pending.clear()
+                pending.append(rest)
+            pending.append(decoder.decode(b"", final=True))
+            if tail := "".join(pending):
+                log_callback(tail)
+
+        return await proc.wait() == 0
@@ -5,16 +5,20 @@
 from __future__ import annotations
 
 import atexit
+import functools
 import importlib.metadata
 import typing
+from pathlib import Path, PurePosixPath
+from urllib.parse import quote, urlsplit
 
 import lsprotocol.types as lsp
 import msgspec
 from marimo._convert.converters import MarimoConvert
+from marimo._utils.platform import is_pyodide
 from pygls.lsp.server import LanguageServer
 from pygls.uris import to_fs_path, uri_scheme
 
-from marimo_lsp.api import handle_api_command
+from marimo_lsp.api import _run_blocking, handle_api_command
 from marimo_lsp.completions import get_completions
 from marimo_lsp.diagnostics import GraphUpdaterRegistry
 from marimo_lsp.loggers import get_logger
@@ -27,6 +31,43 @@ if typing.TYPE_CHECKING:
     from marimo_lsp.kernels import Kernels
 
 
+_CONVERTIBLE_SUFFIXES = (".py", ".ipynb")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_notebook_cell(uri: str) -> bool:
+    """Whether a document URI is a notebook cell rather than a file."""
+    scheme = uri_scheme(uri)
+    return scheme is not None and scheme.endswith("notebook-cell")
+
+
+@functools.lru_cache(maxsize=256)
+def _is_convertible(uri: str) -> bool:
+    """Whether a document URI names a file that can be converted to marimo."""
+    filename = to_fs_path(uri)
+    return filename is not None and filename.endswith(_CONVERTIBLE_SUFFIXES)
+
+
+def _sibling_uri(uri: str, name: str) -> str:
+    """Replace the last path segment of ``uri`` with the file name ``name``."""
+    parts = urlsplit(uri)
+    path = PurePosixPath(parts.path).with_name(quote(name))
+    return parts._replace(path=str(path)).geturl()
+
+
+def _write_new_file(path: str, text: str) -> bool:
+    """Write ``text`` to a new file, returning ``False`` if that isn't possible.
+
+    The file is opened exclusively, so an existing file is never overwritten.
+    """
+    try:
+        with Path(path).open("x", encoding="utf-8") as f:
+            f.write(text)
+    except OSError:
+        return False
+    return True
+
+
 def create_server(*, kernels: Kernels) -> LanguageServer:  # noqa: C901, PLR0915
     """Create the marimo LSP server."""
     server = LanguageServer(
@@ -72,9 +113,9 @@ def create_server(*, kernels: Kernels) -> LanguageServer:  # noqa: C901, PLR0915
 
     @server.feature(lsp.NOTEBOOK_DOCUMENT_DID_CHANGE)
     async def did_change(params: lsp.DidChangeNotebookDocumentParams) -> None:
-        logger.info(f"notebookDocument/didChange {params.notebook_document.uri}")
-        sessions.sync(params.notebook_document.uri, server.workspace)
-        logger.info(f"Synced session {params.notebook_document.uri}")
+        logger.debug(f"notebookDocument/didChange {params.notebook_document.uri}")
+        # Debounced: anything that reads the session applies it first.
+        sessions.schedule_sync(params.notebook_document.uri, server.workspace)
 
         # Schedule debounced recompilation — compiles after 150ms of quiet
         updater = graph_registry.get_or_create(params.notebook_document.uri)
@@ -90,6 +131,10 @@ def create_server(*, kernels: Kernels) -> LanguageServer:  # noqa: C901, PLR0915
     async def did_close(params: lsp.DidCloseNotebookDocumentParams) -> None:
         logger.info(f"notebookDocument/didClose {params.notebook_document.uri}")
 
+        # The notebook is already gone from the workspace, so a debounced
+        # sync from a recent didChange has nothing left to read.
+        sessions.cancel_sync(params.notebook_document.uri)
+
         # Clean up graph updater (cancels pending debounce timer)
         graph_registry.remove(params.notebook_document.uri)
 
@@ -109,7 +154,7 @@ def create_server(*, kernels: Kernels) -> LanguageServer:  # noqa: C901, PLR0915
         pending debounced recompilation so that the response reflects the
         latest cell state.
         """
-        logger.info(f"textDocument/diagnostic {params.text_document.uri}")
+        logger.debug(f"textDocument/diagnostic {params.text_document.uri}")
 
         notebook = server.workspace.get_notebook_document(
             cell_uri=params.text_document.uri
@@ -136,16 +181,14 @@ def create_server(*, kernels: Kernels) -> LanguageServer:  # noqa: C901, PLR0915
     )
     def code_actions(params: lsp.CodeActionParams):
         """Provide code actions for Python files to convert to marimo."""
-        logger.info(f"textDocument/codeAction {params.text_document.uri}")
+        logger.debug(f"textDocument/codeAction {params.text_document.uri}")
 
-        scheme = uri_scheme(params.text_document.uri)
-        if scheme and scheme.endswith("notebook-cell"):
+        if _is_notebook_cell(params.text_document.uri):
             # No code actions for notebook cells (for now)
             return []
 
         actions: list[lsp.CodeAction] = []
-        filename = to_fs_path(params.text_document.uri)
-        if filename and filename.endswith((".py", ".ipynb")):
+        if _is_convertible(params.text_document.uri):
             actions.append(
                 lsp.CodeAction(
                     title="Convert to marimo notebook",
@@ -169,10 +212,9 @@ def create_server(*, kernels: Kernels) -> LanguageServer:  # noqa: C901, PLR0915
     )
     def completions(ls: LanguageServer, params: lsp.CompletionParams):
         """Provide completions for marimo cells."""
-        logger.info(f"textDocument/completion {params.text_document.uri}")
+        logger.debug(f"textDocument/completion {params.text_document.uri}")
 
-        scheme = uri_scheme(params.text_document.uri)
-        if scheme and scheme.endswith("notebook-cell"):
+        if _is_notebook_cell(params.text_document.uri):
             # No completions for notebook cells (for now)
             return []
 
@@ -181,7 +223,7 @@ def create_server(*, kernels: Kernels) -> LanguageServer:  # noqa: C901, PLR0915
     @server.command("marimo.api")
     async def api(ls: LanguageServer, params: typing.Any):  # noqa: ANN401
         """Unified API endpoint for all marimo internal methods."""
-        logger.info("marimo.api")
+        logger.debug("marimo.api")
         args = msgspec.convert(params, type=ApiRequest)
         return await handle_api_command(ls, sessions, args.method, args.params)
 
@@ -199,54 +241,68 @@ def create_server(*, kernels: Kernels) -> LanguageServer:  # noqa: C901, PLR0915
 
         if filename.endswith(".ipynb"):
             ir = MarimoConvert.from_ipynb(text_document.source)
-            new_filename = filename.replace(".ipynb", "_mo.py")
         else:
             ir = MarimoConvert.from_non_marimo_python_script(text_document.source)
-            new_filename = filename.replace(".py", "_mo.py")
 
-        new_uri = text_document.uri.replace(filename, new_filename)
+        # The notebook goes next to the source, e.g. `analysis.ipynb` becomes
+        # `analysis_mo.py`.
+        new_filename = f"{Path(filename).stem}_mo.py"
+        new_uri = _sibling_uri(text_document.uri, new_filename)
         new_text = ir.to_py()
-        result = await ls.workspace_apply_edit_async(
-            lsp.ApplyWorkspaceEditParams(
-                label=f"converted {filename} → {new_filename}",
-                edit=lsp.WorkspaceEdit(
-                    document_changes=[
-                        lsp.CreateFile(
-                            kind="create",
-                            uri=new_uri,
-                            options=lsp.CreateFileOptions(
-                                overwrite=False,
-                                ignore_if_exists=True,
-                            ),
-                        ),
-                        lsp.TextDocumentEdit(
-                            text_document=lsp.OptionalVersionedTextDocumentIdentifier(
+
+        # Write the converted notebook straight to disk rather than sending the
+        # whole source back to the client as an edit. Fall back to a workspace
+        # edit when the file exists or can't be written, for documents that
+        # aren't `file:` URIs (e.g. `untitled:`), and under Pyodide, whose
+        # filesystem the client can't see.
+        new_path = None if is_pyodide() else to_fs_path(new_uri)
+        written = new_path is not None and await _run_blocking(
+            _write_new_file, new_path, new_text
+        )
+        if not written:
+            result = await ls.workspace_apply_edit_async(
+                lsp.ApplyWorkspaceEditParams(
+                    label=f"converted {filename} → {new_filename}",
+                    edit=lsp.WorkspaceEdit(
+                        document_changes=[
+                            lsp.CreateFile(
+                                kind="create",
                                 uri=new_uri,
-                                version=None,
+                                options=lsp.CreateFileOptions(
+                                    overwrite=False,
+                                    ignore_if_exists=True,
+                                ),
                             ),
-                            edits=[
-                                lsp.TextEdit(
-                                    new_text=new_text,
-                                    range=lsp.Range(
-                                        start=lsp.Position(line=0, character=0),
-                                        end=lsp.Position(line=0, character=0),
-                                    ),
-                                )
-                            ],
-                        ),
-                    ],
-                ),
-            )
-        )
-        if result.applied:
-            await ls.window_show_document_async(
-                lsp.ShowDocumentParams(
-                    uri=new_uri,
-                    external=False,
-                    take_focus=True,
-                    selection=None,
+                            lsp.TextDocumentEdit(
+                                text_document=lsp.OptionalVersionedTextDocumentIdentifier(
+                                    uri=new_uri,
+                                    version=None,
+                                ),
+                                edits=[
+                                    lsp.TextEdit(
+                                        new_text=new_text,
+                                        range=lsp.Range(
+                                            start=lsp.Position(line=0, character=0),
+                                            end=lsp.Position(line=0, character=0),
+                                        ),
+                                    )
+                                ],
+                            ),
+                        ],
+                    ),
                 )
             )
+            if not result.applied:
+                return
+
+        await ls.window_show_document_async(
+            lsp.ShowDocumentParams(
+                uri=new_uri,
+                external=False,
+                take_focus=True,
+                selection=None,
+            )
+        )
 
     logger.info("All handlers registered successfully")
 
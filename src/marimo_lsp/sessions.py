@@ -9,6 +9,7 @@ import json
 import threading
 import time
 import typing
+import weakref
 from typing import TYPE_CHECKING, cast
 from uuid import uuid4
 
@@ -35,11 +36,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
 
     from marimo._ast.app import InternalApp
-    from marimo._config.config import (
-        MarimoConfig,
-        PartialMarimoConfig,
-        RuntimeConfig,
-    )
+    from marimo._config.config import MarimoConfig, RuntimeConfig
     from marimo._config.manager import MarimoConfigManager
     from marimo._messaging.types import KernelMessage
     from marimo._session.requests import InstantiateNotebookRequest
@@ -52,12 +49,29 @@ if TYPE_CHECKING:
 
 logger = get_logger()
 
+# Quiet period before a notebook edit is synced into its live session.
+_SYNC_DEBOUNCE_SECONDS = 0.05
+
 
 def _raise_kernel_failure(_session: Session, error: str) -> None:
     """Turn a terminal failure before publication into a launch failure."""
     raise KernelOpenError(error)
 
 
+class _Lifecycle:
+    """Serializes a notebook's session lifecycle operations.
+
+    ``version`` is bumped whenever the notebook's session is closed, moved,
+    or replaced, so an in-flight start can tell it has been superseded.
+    """
+
+    __slots__ = ("__weakref__", "lock", "version")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.version = 0
+
+
 class _OperationSink:
     """Forward operations to the single attached language-server client."""
 
@@ -82,12 +96,11 @@ class _OperationSink:
         """Route future operations to a renamed notebook."""
         self._notebook_uri = notebook_uri
 
-    def notify(self, message: KernelMessage) -> None:
+    def notify(self, operation: dict[str, typing.Any]) -> None:
         if not self._attached:
             return
 
         try:
-            operation = json.loads(message)
             self._server.protocol.notify(
                 "marimo/operation",
                 {"notebookUri": self._notebook_uri, "operation": operation},
@@ -175,12 +188,6 @@ class Session:
         """Return this session's configured marimo settings."""
         return self._config_manager.get_config(hide_secrets=hide_secrets)
 
-    def save_config(self, config: PartialMarimoConfig) -> MarimoConfig:
-        """Persist configuration and apply its effective runtime value."""
-        updated = self._config_manager.save_config(config)
-        self.update_runtime_config(updated)
-        return updated
-
     def sync(self, workspace: Workspace) -> None:
         """Synchronize the live app with the current notebook document."""
         previous_configs = {
@@ -215,17 +222,20 @@ class Session:
         if self._closed:
             return
         self.session_view.add_raw_notification(message)
-        kernel_error = self._update_status(message)
-        self._operation_sink.notify(message)
-        if kernel_error is not None:
-            self._on_kernel_failure(self, kernel_error)
-
-    def _update_status(self, message: KernelMessage) -> str | None:
         try:
+            # Decode once; status tracking and forwarding share the result.
+            # Kernels may send non-finite floats (NaN, Infinity), which only
+            # the stdlib decoder accepts.
             operation = json.loads(message)
         except json.JSONDecodeError:
-            return None
+            logger.exception("Error decoding kernel message")
+            return
+        kernel_error = self._update_status(operation)
+        self._operation_sink.notify(operation)
+        if kernel_error is not None:
+            self._on_kernel_failure(self, kernel_error)
 
+    def _update_status(self, operation: dict[str, typing.Any]) -> str | None:
         if operation.get("op") == "completed-run":
             self._set_status("idle")
         elif operation.get("op") == "cell-op" and operation.get("status") in {
@@ -392,21 +402,23 @@ class Sessions:
         self._kernels = kernels
         self._sessions: dict[str, Session] = {}
         self._lock = threading.RLock()
-        self._lifecycle_locks: dict[str, asyncio.Lock] = {}
-        self._lifecycle_versions: dict[str, int] = {}
-
-    def _lifecycle_lock(self, notebook_uri: str) -> asyncio.Lock:
-        with self._lock:
-            return self._lifecycle_locks.setdefault(notebook_uri, asyncio.Lock())
+        # Lifecycles are only kept alive by the operations holding or awaiting
+        # their lock, so notebooks that were opened once don't pin any state.
+        self._lifecycles: weakref.WeakValueDictionary[str, _Lifecycle] = (
+            weakref.WeakValueDictionary()
+        )
+        # Notebook URI -> (timer, workspace) for a debounced `schedule_sync`.
+        self._pending_syncs: dict[str, tuple[asyncio.TimerHandle, Workspace]] = {}
 
-    def _lifecycle_version(self, notebook_uri: str) -> int:
+    def _lifecycle(self, notebook_uri: str) -> _Lifecycle:
         with self._lock:
-            return self._lifecycle_versions.get(notebook_uri, 0)
+            return self._lifecycles.setdefault(notebook_uri, _Lifecycle())
 
     def _invalidate_lifecycle(self, notebook_uri: str) -> None:
-        self._lifecycle_versions[notebook_uri] = (
-            self._lifecycle_versions.get(notebook_uri, 0) + 1
-        )
+        # Without an operation in flight there's nothing to supersede.
+        lifecycle = self._lifecycles.get(notebook_uri)
+        if lifecycle is not None:
+            lifecycle.version += 1
 
     def __iter__(self) -> Iterator[Session]:
         """Iterate over the live sessions."""
@@ -432,10 +444,26 @@ class Sessions:
             )
 
     def get(self, notebook_uri: str) -> Session | None:
-        """Return the live session for a notebook, if one exists."""
+        """Return the live session for a notebook, if one exists.
+
+        A pending debounced sync is applied first, so callers always see the
+        notebook's current cells.
+        """
+        pending = self._pending_syncs.get(notebook_uri)
+        if pending is not None:
+            self._run_scheduled_sync(notebook_uri, pending[1])
+        return self._lookup(notebook_uri)
+
+    def _lookup(self, notebook_uri: str) -> Session | None:
         with self._lock:
             return self._sessions.get(notebook_uri)
 
+    def cancel_sync(self, notebook_uri: str) -> None:
+        """Drop a notebook's pending debounced sync, if any."""
+        pending = self._pending_syncs.pop(notebook_uri, None)
+        if pending is not None:
+            pending[0].cancel()
+
     async def start(
         self,
         notebook_uri: str,
@@ -447,18 +475,19 @@ class Sessions:
         A different executable replaces the existing session only after the
         replacement has started successfully.
         """
-        async with self._lifecycle_lock(notebook_uri):
+        lifecycle = self._lifecycle(notebook_uri)
+        async with lifecycle.lock:
             current = self.get(notebook_uri)
             if current is not None and current.executable == executable:
                 current.attach()
                 return current
 
-            version = self._lifecycle_version(notebook_uri)
+            version = lifecycle.version
             replacement = await self._create(
                 notebook_uri, executable, working_directory
             )
             with self._lock:
-                if version != self._lifecycle_version(notebook_uri):
+                if version != lifecycle.version:
                     superseded = True
                 else:
                     superseded = False
@@ -554,12 +583,13 @@ class Sessions:
         create_if_missing: bool = False,
     ) -> Session | None:
         """Atomically replace a live session's kernel."""
-        async with self._lifecycle_lock(notebook_uri):
+        lifecycle = self._lifecycle(notebook_uri)
+        async with lifecycle.lock:
             current = self.get(notebook_uri)
             if current is None and not create_if_missing:
                 return None
 
-            version = self._lifecycle_version(notebook_uri)
+            version = lifecycle.version
             if current is None:
                 replacement = await self._create(
                     notebook_uri, executable, working_directory
@@ -575,7 +605,7 @@ class Sessions:
                     replacement.detach(notify=False)
 
             with self._lock:
-                if version != self._lifecycle_version(notebook_uri):
+                if version != lifecycle.version:
                     superseded = True
                 else:
                     superseded = False
@@ -595,6 +625,7 @@ class Sessions:
 
     def move(self, notebook_uri: str, new_notebook_uri: str) -> None:
         """Move a live session to a renamed notebook URI."""
+        self.cancel_sync(notebook_uri)
         with self._lock:
             self._invalidate_lifecycle(notebook_uri)
             session = self._sessions.pop(notebook_uri, None)
@@ -624,18 +655,44 @@ class Sessions:
 
     def sync(self, notebook_uri: str, workspace: Workspace) -> None:
         """Synchronize an existing session with its notebook document."""
-        session = self.get(notebook_uri)
+        self.cancel_sync(notebook_uri)
+        session = self._lookup(notebook_uri)
         if session is not None:
             session.sync(workspace)
 
+    def schedule_sync(self, notebook_uri: str, workspace: Workspace) -> None:
+        """Schedule a debounced `sync` of an existing session.
+
+        Each call resets the timer, so a burst of edits is synced once after
+        ``_SYNC_DEBOUNCE_SECONDS`` of quiet.
+        """
+        self.cancel_sync(notebook_uri)
+        if self._lookup(notebook_uri) is None:
+            return
+        loop = asyncio.get_running_loop()
+        handle = loop.call_later(
+            _SYNC_DEBOUNCE_SECONDS, self._run_scheduled_sync, notebook_uri, workspace
+        )
+        self._pending_syncs[notebook_uri] = (handle, workspace)
+
+    def _run_scheduled_sync(self, notebook_uri: str, workspace: Workspace) -> None:
+        # The notebook may have been closed (and dropped from the workspace)
+        # since the sync was scheduled; there's nothing left to sync then.
+        try:
+            self.sync(notebook_uri, workspace)
+        except KeyError:
+            logger.debug(f"Skipped sync for closed notebook {notebook_uri}")
+
     def detach(self, notebook_uri: str) -> None:
         """Detach an existing session without stopping its kernel."""
-        session = self.get(notebook_uri)
+        self.cancel_sync(notebook_uri)
+        session = self._lookup(notebook_uri)
         if session is not None:
             session.detach()
 
     def close(self, notebook_uri: str) -> None:
         """Close and forget a notebook's session."""
+        self.cancel_sync(notebook_uri)
         with self._lock:
             self._invalidate_lifecycle(notebook_uri)
             session = self._sessions.pop(notebook_uri, None)
@@ -671,9 +728,11 @@ class Sessions:
     def close_all(self) -> None:
         """Close all live sessions."""
         logger.info("Closing all sessions")
+        for notebook_uri in list(self._pending_syncs):
+            self.cancel_sync(notebook_uri)
         with self._lock:
-            for notebook_uri in self._lifecycle_locks:
-                self._invalidate_lifecycle(notebook_uri)
+            for lifecycle in list(self._lifecycles.values()):
+                lifecycle.version += 1
             live = self._sessions
             self._sessions = {}
         for notebook_uri, session in live.items():
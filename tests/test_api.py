@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, cast
 from unittest.mock import MagicMock, patch
 
@@ -14,7 +15,9 @@ from marimo._types.ids import RequestId
 from marimo_lsp.api import (
     ApiBuilder,
     ApiContext,
+    _package_manager_for,
     _restore_unknown_app_options,
+    _run_blocking,
     deserialize,
     export_as_markdown,
     get_configuration,
@@ -33,8 +36,10 @@ from marimo_lsp.models import (
     ListSQLSchemasRequest,
     ListSQLTablesRequest,
     NotebookCommand,
+    ScriptSource,
     SetDisplayThemeRequest,
     UpdateConfigurationRequest,
+    VenvSource,
 )
 
 if TYPE_CHECKING:
@@ -320,7 +325,7 @@ def test_api_builder_rejects_duplicate_methods() -> None:
 @pytest.mark.asyncio
 async def test_update_configuration_returns_saved_config() -> None:
     session = MagicMock()
-    session.save_config.return_value = DEFAULT_CONFIG
+    session.config_manager.save_config.return_value = DEFAULT_CONFIG
     sessions = MagicMock()
     sessions.get.return_value = session
 
@@ -333,6 +338,7 @@ async def test_update_configuration_returns_saved_config() -> None:
     )
 
     assert result == DEFAULT_CONFIG
+    session.update_runtime_config.assert_called_once_with(DEFAULT_CONFIG)
 
 
 @pytest.mark.asyncio
@@ -387,7 +393,7 @@ async def test_get_configuration_loads_without_session() -> None:
 @pytest.mark.asyncio
 async def test_update_configuration_propagates_save_errors() -> None:
     session = MagicMock()
-    session.save_config.side_effect = OSError("config is read-only")
+    session.config_manager.save_config.side_effect = OSError("config is read-only")
     sessions = MagicMock()
     sessions.get.return_value = session
 
@@ -400,6 +406,8 @@ async def test_update_configuration_propagates_save_errors() -> None:
             ),
         )
 
+    session.update_runtime_config.assert_not_called()
+
 
 def test_display_theme_rejects_unresolved_theme() -> None:
     with pytest.raises(msgspec.ValidationError):
@@ -492,3 +500,26 @@ async def test_list_sql_metadata_rejects_a_missing_session(
             _context(sessions),
             NotebookCommand(notebook_uri=NOTEBOOK_URI, inner=sql_request),
         )
+
+
+def test_package_manager_is_reused_per_source() -> None:
+    venv = _package_manager_for(VenvSource(executable="/venv/bin/python"))
+
+    assert _package_manager_for(VenvSource(executable="/venv/bin/python")) is venv
+    assert _package_manager_for(VenvSource(executable="/other/bin/python")) is not venv
+    assert _package_manager_for(ScriptSource()) is _package_manager_for(ScriptSource())
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_uses_a_worker_thread() -> None:
+    thread = await _run_blocking(threading.current_thread)
+
+    assert thread is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_runs_inline_under_pyodide() -> None:
+    with patch("marimo_lsp.api.is_pyodide", return_value=True):
+        thread = await _run_blocking(threading.current_thread)
+
+    assert thread is threading.current_thread()
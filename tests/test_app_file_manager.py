@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from typing import cast
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import lsprotocol.types as lsp
 import msgspec
@@ -173,3 +173,40 @@ class TestSyncAppWithWorkspace:
         ws = _make_workspace_with_metadata(uri, metadata=None)
         app = sync_app_with_workspace(workspace=ws, notebook_uri=uri, app=None)
         assert app.config.width == "compact"
+
+
+def _make_workspace_with_cell(uri: str, source: str) -> MagicMock:
+    cell_uri = f"{uri}#cell-1"
+    workspace = _make_workspace_with_metadata(
+        uri,
+        metadata={},
+        cells=[
+            lsp.NotebookCell(
+                kind=lsp.NotebookCellKind.Code,
+                document=cell_uri,
+                metadata=_lsp_object({"marimoRuntime": {"stableId": "cell-1"}}),
+            )
+        ],
+    )
+    document = MagicMock()
+    document.source = source
+    document.language_id = "python"
+    workspace.text_documents = {cell_uri: document}
+    return workspace
+
+
+class TestSyncAppWithWorkspaceSkipsUnchanged:
+    def test_unchanged_notebook_skips_rebuild(self) -> None:
+        uri = "file:///test/notebook.py"
+        ws = _make_workspace_with_cell(uri, "x = 1")
+        app = sync_app_with_workspace(workspace=ws, notebook_uri=uri, app=None)
+
+        with patch.object(app, "with_data", wraps=app.with_data) as with_data:
+            sync_app_with_workspace(workspace=ws, notebook_uri=uri, app=app)
+            with_data.assert_not_called()
+
+            ws.text_documents[f"{uri}#cell-1"].source = "x = 2"
+            sync_app_with_workspace(workspace=ws, notebook_uri=uri, app=app)
+            with_data.assert_called_once()
+
+        assert list(app.cell_manager.codes()) == ["x = 2"]
@@ -13,11 +13,13 @@ import lsprotocol.types as lsp
 import msgspec
 import pytest
 from inline_snapshot import snapshot
+from marimo._ast.compiler import compile_cell
 from marimo._types.ids import CellId_t
 
 from marimo_lsp.diagnostics import (
     GraphUpdaterRegistry,
     NotebookGraphUpdater,
+    _referring_cells_by_variable,
     _snapshot_variables,
 )
 from marimo_lsp.models import (
@@ -193,6 +195,114 @@ class TestNotebookGraphUpdater:
         assert "y" not in var_names
         assert "x" in var_names
 
+    def test_unchanged_flush_skips_diagnostics(self) -> None:
+        """A flush with no source or layout changes should not republish."""
+        server = _make_server(
+            [
+                ("cell1", "x = 1"),
+                ("cell2", "x = 2"),
+            ]
+        )
+        updater = NotebookGraphUpdater(server, "file:///test.py")
+        updater.flush()
+        published = server.text_document_publish_diagnostics.call_count
+        assert published == 2
+
+        updater.flush()
+        assert server.text_document_publish_diagnostics.call_count == published
+
+        # Reordering cells changes names in messages, so it recomputes
+        notebook = server.workspace.get_notebook_document.return_value
+        notebook.cells = list(reversed(notebook.cells))
+        updater.flush()
+        assert server.text_document_publish_diagnostics.call_count == published + 2
+
+    def test_only_changed_diagnostics_are_published(self) -> None:
+        """Cells whose diagnostics didn't change should not be republished."""
+        server = _make_server(
+            [
+                ("cell1", "x = 1"),
+                ("cell2", "x = 2"),
+                ("cell3", "y = 1"),
+            ]
+        )
+        docs = server.workspace.text_documents
+        updater = NotebookGraphUpdater(server, "file:///test.py")
+        updater.flush()
+        assert server.text_document_publish_diagnostics.call_count == 2
+
+        # Unrelated edit: the duplicate definition diagnostics are unchanged
+        docs["file:///test.py#cell-cell3"].source = "y = 2"
+        updater.flush()
+        assert server.text_document_publish_diagnostics.call_count == 2
+
+        # Resolving the duplicate clears both cells
+        docs["file:///test.py#cell-cell2"].source = "z = 2"
+        updater.flush()
+        assert server.text_document_publish_diagnostics.call_count == 4
+        calls = server.text_document_publish_diagnostics.call_args_list
+        published = [call.args[0] for call in calls]
+        assert {p.uri for p in published[2:]} == {
+            "file:///test.py#cell-cell1",
+            "file:///test.py#cell-cell2",
+        }
+        assert all(p.diagnostics == [] for p in published[2:])
+
+    def test_reverted_source_reuses_compiled_cell(self) -> None:
+        """Going back to a previously compiled source should not recompile."""
+        server = _make_server([("cell1", "x = 1")])
+        doc = server.workspace.text_documents["file:///test.py#cell-cell1"]
+
+        with patch(
+            "marimo_lsp.diagnostics.compile_cell", wraps=compile_cell
+        ) as compile_mock:
+            updater = NotebookGraphUpdater(server, "file:///test.py")
+            updater.flush()
+            doc.source = "x = 2"
+            updater.flush()
+            doc.source = "x = 1"
+            updater.flush()
+
+        assert compile_mock.call_count == 2
+        assert "x" in updater._graph.definitions
+
+    def test_syntax_errors_are_cached(self) -> None:
+        """A source already known not to parse should not be compiled again."""
+        server = _make_server([("cell1", "x = (")])
+        doc = server.workspace.text_documents["file:///test.py#cell-cell1"]
+
+        with patch(
+            "marimo_lsp.diagnostics.compile_cell", wraps=compile_cell
+        ) as compile_mock:
+            updater = NotebookGraphUpdater(server, "file:///test.py")
+            updater.flush()
+            doc.source = "x = 1"
+            updater.flush()
+            doc.source = "x = ("
+            updater.flush()
+
+        assert compile_mock.call_count == 2
+        assert "x" not in updater._graph.definitions
+
+    def test_metadata_decoded_again_only_when_replaced(self) -> None:
+        """Unchanged cell metadata should not be re-decoded on every flush."""
+        server = _make_server([("cell1", "x = 1")])
+        updater = NotebookGraphUpdater(server, "file:///test.py")
+
+        with patch(
+            "marimo_lsp.diagnostics.decode_cell_metadata",
+            wraps=decode_cell_metadata,
+        ) as decode:
+            updater.flush()
+            updater.flush()
+            assert decode.call_count == 1
+
+            # A metadata change arrives as a new object
+            cell = server.workspace.get_notebook_document.return_value.cells[0]
+            cell.metadata = _cell_metadata(stable_id="cell1")
+            updater.flush()
+            assert decode.call_count == 2
+
     def test_cells_without_stable_id_skipped(self) -> None:
         """Cells missing stableId metadata should be silently skipped."""
         server = MagicMock()
@@ -362,6 +472,33 @@ class TestSnapshotVariables:
         assert cell2 in used_by
 
 
+class TestReferringCellsByVariable:
+    """Tests for the _referring_cells_by_variable helper."""
+
+    def test_matches_graph_get_referring_cells(self) -> None:
+        """The one-pass index should agree with per-variable graph queries."""
+        from marimo._runtime.dataflow import DirectedGraph
+
+        graph = DirectedGraph()
+        for cell_id, code in [
+            ("cell1", "x = 1"),
+            ("cell2", "y = x + 1"),
+            ("cell3", "z = x + y"),
+            ("cell4", "print(w)"),
+        ]:
+            graph.register_cell(
+                cell_id=CellId_t(cell_id),
+                cell=compile_cell(cell_id=CellId_t(cell_id), code=code),
+            )
+
+        referring = _referring_cells_by_variable(graph)
+
+        for name in ("x", "y", "z", "w", "print"):
+            assert referring.get(name, set()) == graph.get_referring_cells(
+                name, language="python"
+            )
+
+
 class TestCellMetadataHelpers:
     """Unit tests for cell metadata helper functions."""
 
@@ -4,19 +4,42 @@ from __future__ import annotations
 
 import asyncio
 import threading
+import time
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from unittest.mock import Mock
 
 import pytest
 
-from marimo_lsp.kernels.manager import Manager
+from marimo_lsp.kernels.manager import Manager, Process, launch_kernel
 from marimo_lsp.kernels.native import NativeKernels
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
     from pathlib import Path
 
 
+@pytest.fixture
+def launch_fake_kernel(tmp_path: Path) -> Generator[Callable[..., Process]]:
+    """Launch kernels that read their arguments, then run the given sh lines."""
+    launched: list[Process] = []
+
+    def launch(*lines: str) -> Process:
+        executable = tmp_path / "fake-python"
+        executable.write_text("\n".join(["#!/bin/sh", "cat > /dev/null", *lines, ""]))
+        executable.chmod(0o755)
+        args = Mock()
+        args.encode_json.return_value = b"{}"
+        process = launch_kernel(str(executable), args)
+        launched.append(process)
+        return process
+
+    yield launch
+
+    for process in launched:
+        process.terminate()
+
+
 def _manager(notebook: Path, working_directory: str) -> Manager:
     manager = Manager.__new__(Manager)
     manager.executable = "/usr/bin/python"
@@ -147,3 +170,77 @@ async def test_cancelled_launch_closes_kernel_after_start_finishes(
 
     finish.set()
     assert await asyncio.to_thread(closed.wait, 1)
+
+
+def test_launch_kernel_does_not_block_on_stderr_output(
+    launch_fake_kernel: Callable[..., Process],
+) -> None:
+    # More than a pipe buffer of stderr before the handshake
+    process = launch_fake_kernel(
+        "head -c 262144 /dev/zero >&2", "echo KERNEL_READY", "exec sleep 30"
+    )
+
+    assert process.is_alive()
+
+
+def test_launch_kernel_reports_stderr_on_failure(
+    launch_fake_kernel: Callable[..., Process],
+) -> None:
+    with pytest.raises(RuntimeError, match=r"exit code 3\): boom"):
+        launch_fake_kernel("echo boom >&2", "exit 3")
+
+
+def test_launch_kernel_drains_stdout_after_handshake(
+    tmp_path: Path, launch_fake_kernel: Callable[..., Process]
+) -> None:
+    marker = tmp_path / "flushed"
+
+    launch_fake_kernel(
+        "echo KERNEL_READY",
+        "head -c 262144 /dev/zero | tr '\\0' 'x'",
+        f"touch {marker}",
+        "exec sleep 30",
+    )
+
+    deadline = time.monotonic() + 5
+    while not marker.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert marker.exists()
+
+
+def test_launch_kernel_logs_stderr_after_handshake(
+    launch_fake_kernel: Callable[..., Process], caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level("DEBUG", logger="marimo-lsp"):
+        process = launch_fake_kernel(
+            "echo KERNEL_READY", "echo 'Traceback: crashed' >&2", "exit 1"
+        )
+        process.inner.wait(timeout=5)
+        deadline = time.monotonic() + 5
+        while "Traceback: crashed" not in caplog.text:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+
+def test_launch_kernel_shares_one_drain_thread(
+    launch_fake_kernel: Callable[..., Process],
+) -> None:
+    launch_fake_kernel("echo KERNEL_READY", "exec sleep 30")
+    threads = threading.active_count()
+
+    for _ in range(3):
+        launch_fake_kernel("echo KERNEL_READY", "exec sleep 30")
+
+    assert threading.active_count() == threads
+
+
+def test_launch_kernel_logs_stdout_written_with_the_handshake(
+    launch_fake_kernel: Callable[..., Process], caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level("DEBUG", logger="marimo-lsp"):
+        process = launch_fake_kernel("printf 'KERNEL_READY\\nhello\\n'", "exit 0")
+        process.inner.wait(timeout=5)
+        deadline = time.monotonic() + 5
+        while "hello" not in caplog.text:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
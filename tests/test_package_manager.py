@@ -0,0 +1,59 @@
+# Copyright 2026 Marimo. All rights reserved.
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from marimo_lsp.package_manager import LspPackageManager
+
+
+def _manager() -> LspPackageManager:
+    delegate = Mock()
+    delegate.is_manager_installed.return_value = True
+    return LspPackageManager(delegate=delegate)
+
+
+@pytest.mark.asyncio
+async def test_run_streams_complete_lines_to_callback(
+    capfd: pytest.CaptureFixture[str],
+) -> None:
+    script = (
+        "import sys\n"
+        "for i in range(2000): print(f'line {i}')\n"
+        "sys.stdout.write('no newline')\n"
+    )
+    lines: list[str] = []
+
+    ok = await _manager().run([sys.executable, "-c", script], lines.append)
+
+    assert ok
+    assert lines == [*(f"line {i}\n" for i in range(2000)), "no newline"]
+    assert capfd.readouterr().out == "".join(lines)
+
+
+@pytest.mark.asyncio
+async def test_run_reports_failure_exit_code() -> None:
+    lines: list[str] = []
+
+    ok = await _manager().run(
+        [sys.executable, "-c", "import sys; print('bad'); sys.exit(1)"],
+        lines.append,
+    )
+
+    assert not ok
+    assert lines == ["bad\n"]
+
+
+@pytest.mark.asyncio
+async def test_run_keeps_long_lines_and_multibyte_characters_whole() -> None:
+    # Each line is longer than a read chunk and ends in a two-byte character.
+    script = "for _ in range(3): print('x' * 65535 + 'é')\n"
+    lines: list[str] = []
+
+    ok = await _manager().run([sys.executable, "-c", script], lines.append)
+
+    assert ok
+    assert lines == ["x" * 65535 + "é\n"] * 3
@@ -2114,3 +2114,29 @@ async def test_scratchpad_creates_session_when_missing(
         and op["operation"]["console"].get("channel") == "stdout"
     )
     assert stdout == snapshot("from new session\n")
+
+
+@pytest.mark.asyncio
+async def test_marimo_convert_writes_notebook_next_to_source(
+    client: LanguageClient, tmp_path: Path
+) -> None:
+    # A ".py" earlier in the path must not be rewritten
+    directory = tmp_path / "scripts.py"
+    directory.mkdir()
+    source = directory / "analysis.py"
+    uri = source.as_uri()
+    client.text_document_did_open(
+        lsp.DidOpenTextDocumentParams(
+            text_document=lsp.TextDocumentItem(
+                uri=uri, language_id="python", version=1, text="x = 1\nprint(x)\n"
+            )
+        )
+    )
+
+    await client.workspace_execute_command_async(
+        lsp.ExecuteCommandParams(command="marimo.convert", arguments=[{"uri": uri}])
+    )
+
+    target = directory / "analysis_mo.py"
+    assert "app = marimo.App(" in target.read_text(encoding="utf-8")
+    assert [doc.uri for doc in client.shown_documents] == [target.as_uri()]
@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import gc
+import math
 import threading
 from typing import TYPE_CHECKING, cast
 from unittest.mock import ANY, AsyncMock, Mock
@@ -226,7 +228,7 @@ def test_detached_session_keeps_auto_reload_paused_after_config_update() -> None
 def test_detached_operation_sink_drops_messages_until_reattached() -> None:
     server = Mock()
     sink = _OperationSink(server, "file:///test.py")
-    message = KernelMessage(b'{"op": "completed-run", "run_id": null}')
+    message = {"op": "completed-run", "run_id": None}
 
     sink.detach()
     sink.notify(message)
@@ -248,10 +250,10 @@ def test_detached_operation_sink_drops_messages_until_reattached() -> None:
 def test_session_status_tracks_running_and_completed_operations() -> None:
     session, _ = _make_session()
 
-    session._update_status(KernelMessage(b'{"op": "cell-op", "status": "running"}'))
+    session._update_status({"op": "cell-op", "status": "running"})
     assert session._status == "running"
 
-    session._update_status(KernelMessage(b'{"op": "completed-run"}'))
+    session._update_status({"op": "completed-run"})
     assert session._status == "idle"
     assert session._on_change.call_count == 2
 
@@ -280,7 +282,28 @@ def test_terminal_kernel_operation_invokes_failure_callback() -> None:
     session.accept_kernel_message(message)
 
     session._on_kernel_failure.assert_called_once_with(session, "bridge exited")
-    session._operation_sink.notify.assert_called_once_with(message)
+    session._operation_sink.notify.assert_called_once_with(
+        {"op": "kernel-startup-error", "error": "bridge exited"}
+    )
+
+
+def test_kernel_operation_with_non_finite_numbers_is_forwarded() -> None:
+    session, _queue_manager = _make_session()
+    session._closed = False
+    session._operation_sink = Mock()
+    session.session_view = Mock()
+    message = KernelMessage(
+        b'{"op": "send-ui-element-message", "ui_element": "slider", '
+        b'"message": {"values": [NaN, Infinity, -Infinity]}, "buffers": []}'
+    )
+
+    session.accept_kernel_message(message)
+
+    (operation,), _ = session._operation_sink.notify.call_args
+    assert operation["op"] == "send-ui-element-message"
+    values = operation["message"]["values"]
+    assert math.isnan(values[0])
+    assert values[1:] == [math.inf, -math.inf]
 
 
 def test_sessions_changed_notification_contains_public_snapshot() -> None:
@@ -447,6 +470,19 @@ async def test_close_during_start_discards_launched_kernel() -> None:
     replacement.close.assert_called_once_with()
 
 
+@pytest.mark.asyncio
+async def test_lifecycle_state_is_dropped_once_idle() -> None:
+    sessions = Sessions(Mock(), kernels=Mock())
+    sessions._create = AsyncMock(return_value=Mock(spec=Session))
+    sessions._notify_changed = Mock()
+
+    await sessions.start("file:///test.py", "/usr/bin/python", "/workspace")
+    sessions.close("file:///test.py")
+    gc.collect()
+
+    assert len(sessions._lifecycles) == 0
+
+
 @pytest.mark.asyncio
 async def test_session_creation_failure_closes_launched_kernel() -> None:
     kernel = Mock()
@@ -662,3 +698,90 @@ def test_close_all_clears_collection_and_notifies_once() -> None:
     first.close.assert_called_once_with()
     second.close.assert_called_once_with()
     sessions._notify_changed.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_schedule_sync_coalesces_a_burst_of_edits() -> None:
+    sessions = Sessions(Mock(), kernels=Mock())
+    session = Mock(spec=Session)
+    sessions._sessions["file:///test.py"] = session
+    workspace = Mock()
+
+    for _ in range(5):
+        sessions.schedule_sync("file:///test.py", workspace)
+    session.sync.assert_not_called()
+
+    await asyncio.sleep(0.1)
+
+    session.sync.assert_called_once_with(workspace)
+
+
+@pytest.mark.asyncio
+async def test_get_applies_a_pending_sync() -> None:
+    sessions = Sessions(Mock(), kernels=Mock())
+    session = Mock(spec=Session)
+    sessions._sessions["file:///test.py"] = session
+    workspace = Mock()
+
+    sessions.schedule_sync("file:///test.py", workspace)
+
+    assert sessions.get("file:///test.py") is session
+    session.sync.assert_called_once_with(workspace)
+
+    await asyncio.sleep(0.1)
+
+    session.sync.assert_called_once_with(workspace)
+
+
+@pytest.mark.asyncio
+async def test_detach_cancels_a_pending_sync() -> None:
+    sessions = Sessions(Mock(), kernels=Mock())
+    session = Mock(spec=Session)
+    sessions._sessions["file:///test.py"] = session
+
+    sessions.schedule_sync("file:///test.py", Mock())
+    sessions.detach("file:///test.py")
+    await asyncio.sleep(0.1)
+
+    session.sync.assert_not_called()
+    session.detach.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_change_then_close_within_debounce_window() -> None:
+    sessions = Sessions(Mock(), kernels=Mock())
+    session = Mock(spec=Session)
+    sessions._sessions["file:///test.py"] = session
+    errors: list[dict[str, object]] = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda _loop, context: errors.append(context)
+    )
+
+    sessions.schedule_sync("file:///test.py", Mock())
+    sessions.cancel_sync("file:///test.py")
+    await asyncio.sleep(0.1)
+
+    session.sync.assert_not_called()
+    assert errors == []
+
+
+@pytest.mark.asyncio
+async def test_scheduled_sync_tolerates_a_closed_notebook() -> None:
+    sessions = Sessions(Mock(), kernels=Mock())
+    session = Mock(spec=Session)
+    # The notebook is no longer in the workspace
+    session.sync.side_effect = KeyError("file:///test.py")
+    sessions._sessions["file:///test.py"] = session
+    errors: list[dict[str, object]] = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda _loop, context: errors.append(context)
+    )
+
+    sessions.schedule_sync("file:///test.py", Mock())
+    await asyncio.sleep(0.1)
+
+    session.sync.assert_called_once()
+    assert errors == []
+
+    sessions.schedule_sync("file:///test.py", Mock())
+    assert sessions.get("file:///test.py") is session